@@ -3,32 +3,250 @@ Architecture-specific configuration and research customizations.
 This module provides specialized research behavior for architecture trend reports.
 """
 
+from dataclasses import dataclass
+from functools import cache, lru_cache
+from string import Formatter
+from typing import ClassVar, Optional
+
 from .architecture_prompts import (
     architecture_research_topic_prompt,
     architecture_research_instructions,
     architecture_report_template,
-    location_based_research_prompt
+    location_based_research_prompt,
+    architecture_fused_brief_and_report_prompt
+)
+
+def _compile_template(template):
+    """Pre-parse a str.format template into a renderer that joins constant segments.
+    
+    Only plain ``{name}`` fields are supported, which is all the architecture prompts use.
+    """
+    literals = []
+    names = []
+    for literal, name, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion or (name is not None and not name.isidentifier()):
+            raise ValueError(f"Unsupported template field in prompt: {name!r}")
+        literals.append(literal)
+        names.append(name)
+    segments = tuple(zip(literals, names))
+    
+    def render(**values):
+        parts = []
+        for literal, name in segments:
+            parts.append(literal)
+            if name is not None:
+                parts.append(str(values[name]))
+        return "".join(parts)
+    
+    return render
+
+# Prompt templates are parsed once at import time rather than on every research run
+_render_research_topic_prompt = _compile_template(architecture_research_topic_prompt)
+_render_report_template = _compile_template(architecture_report_template)
+_render_location_prompt = _compile_template(location_based_research_prompt)
+_render_fused_prompt = _compile_template(architecture_fused_brief_and_report_prompt)
+
+# Stands in for the brief inside the fused prompt, where the model writes the brief itself
+FUSED_BRIEF_PLACEHOLDER = "[The research brief you wrote in Task 1]"
+
+# Static research data shared by every configuration instance; allocated once at import time.
+# These are immutable tuples; callers that need to modify one should copy it with list(...) first.
+ARCHITECTURE_KEYWORDS = (
+    "architecture trends",
+    "building design",
+    "construction innovation",
+    "sustainable architecture",
+    "green building",
+    "smart buildings",
+    "architectural materials",
+    "design trends",
+    "building technology",
+    "energy efficiency",
+    "LEED certification",
+    "biophilic design",
+    "modular construction",
+    "prefab architecture"
+)
+
+PRIMARY_SOURCES = (
+    "archidaily.com",
+    "dezeen.com",
+    "architecturaldigest.com",
+    "architecturalrecord.com",
+    "metropolismag.com",
+    "aia.org",
+    "usgbc.org",
+    "construction.com",
+    "bdcnetwork.com",
+    "greenbuildingadvisor.com"
+)
+
+SECONDARY_SOURCES = (
+    "archdaily.com",
+    "designboom.com",
+    "inhabitat.com",
+    "treehugger.com",
+    "constructiondive.com",
+    "buildinggreendigital.com",
+    "contractormag.com",
+    "constructionexec.com"
+)
+
+ACADEMIC_SOURCES = (
+    "sciencedirect.com",
+    "scholar.google.com",
+    "researchgate.net",
+    "ieee.org",
+    "journals.sagepub.com"
 )
 
+# Lowercase sets for content membership tests
+REQUIRED_KEYWORDS = frozenset({
+    "architecture", "building", "design", "construction",
+    "sustainable", "trends", "innovation", "technology"
+})
+
+# Word forms that count as an occurrence of each required keyword
+REQUIRED_KEYWORD_VARIANTS = {
+    "architecture": ("architecture", "architectures", "architectural"),
+    "building": ("building", "buildings"),
+    "design": ("design", "designs", "designed", "designing", "designer", "designers"),
+    "construction": ("construction", "constructions"),
+    "sustainable": ("sustainable", "sustainably", "sustainability"),
+    "trends": ("trends", "trend", "trending"),
+    "innovation": ("innovation", "innovations", "innovative"),
+    "technology": ("technology", "technologies", "technological"),
+}
+
+EXCLUDE_PATTERNS = frozenset({
+    "listicle", "top 10", "clickbait", "advertisement",
+    "sponsored content", "press release"
+})
+
+REQUIRED_ELEMENTS = (
+    "specific examples",
+    "expert quotes",
+    "quantitative data",
+    "project details"
+)
+
+REQUIRED_SECTIONS = (
+    "Executive Summary",
+    "Current Market Landscape",
+    "Top Architecture Trends",
+    "Implementation Recommendations",
+    "Sources"
+)
+
+@lru_cache(maxsize=128)
+def _location_enhancement(location):
+    """Render the location-specific research prompt; memoized per location."""
+    return _render_location_prompt(location=location)
+
+@lru_cache(maxsize=128)
+def _search_keyword_terms(location, year):
+    """Pre-build the query-independent keyword terms; memoized per (location, year)."""
+    architecture_keywords = list(ARCHITECTURE_KEYWORDS)
+    
+    # Add location-specific terms if specified
+    if location and location != "Global":
+        location_terms = [
+            f"{location} architecture",
+            f"{location} building codes",
+            f"{location} construction trends",
+            f"{location} real estate"
+        ]
+        architecture_keywords.extend(location_terms)
+    
+    # Add year-specific terms
+    year_terms = [
+        f"{year} architecture trends",
+        f"{year} building trends",
+        f"{year} construction trends"
+    ]
+    architecture_keywords.extend(year_terms)
+    
+    enhanced_suffix = f" {' '.join(architecture_keywords[:5])}"
+    fallback_suffixes = (
+        f" architecture design trends {year}",
+        f" building construction innovation {location}",
+        f" sustainable architecture {year}",
+        " smart building technology trends"
+    )
+    return enhanced_suffix, fallback_suffixes
+
+# Query-independent research data is built once and shared by every configuration instance
+SOURCE_PRIORITIES = {
+    "primary_sources": PRIMARY_SOURCES,
+    "secondary_sources": SECONDARY_SOURCES,
+    "academic_sources": ACADEMIC_SOURCES
+}
+
+VALIDATION_CRITERIA = {
+    "content_requirements": {
+        "minimum_trends": 3,
+        "minimum_examples_per_trend": 2,
+        "minimum_sources": 10,
+        "required_sections": REQUIRED_SECTIONS
+    },
+    "quality_indicators": {
+        "specific_project_examples": True,
+        "cost_information": True,
+        "timeline_projections": True,
+        "expert_quotes": True,
+        "quantitative_data": True,
+        "regional_considerations": True
+    },
+    "technical_depth": {
+        "material_specifications": True,
+        "technology_details": True,
+        "implementation_challenges": True,
+        "regulatory_considerations": True
+    }
+}
+
+@cache
+def _quality_filters(year):
+    """Build the quality filters for a target year; memoized per year."""
+    return {
+        "required_keywords": REQUIRED_KEYWORDS,
+        "preferred_date_range": {
+            "start_year": year - 2,
+            "end_year": year + 1
+        },
+        "exclude_patterns": EXCLUDE_PATTERNS,
+        "minimum_content_length": 500,  # words
+        "required_elements": REQUIRED_ELEMENTS
+    }
+
+@dataclass(frozen=True, slots=True)
 class ArchitectureResearchConfig:
-    """Configuration class for architecture-specific research behavior."""
+    """Configuration class for architecture-specific research behavior.
+    
+    Instances are immutable and hashable, so they can be shared across research runs.
+    """
     
-    def __init__(self, location=None, year=None, industry_focus=None):
-        self.location = location or "United States"
-        self.year = year or 2025
-        self.industry_focus = industry_focus or "Architecture & Construction"
+    location: Optional[str] = None
+    year: Optional[int] = None
+    industry_focus: Optional[str] = None
+    
+    # Shared by every instance; prefer this over get_research_instructions() on hot paths
+    research_instructions: ClassVar[str] = architecture_research_instructions
+    
+    def __post_init__(self):
+        object.__setattr__(self, "location", self.location or "United States")
+        object.__setattr__(self, "year", self.year or 2025)
+        object.__setattr__(self, "industry_focus", self.industry_focus or "Architecture & Construction")
         
     def get_enhanced_research_prompt(self, messages, date):
         """Get architecture-specific research topic transformation prompt."""
-        base_prompt = architecture_research_topic_prompt.format(
+        base_prompt = _render_research_topic_prompt(
             messages=messages, 
             date=date
         )
         
         if self.location and self.location != "Global":
-            location_enhancement = location_based_research_prompt.format(
-                location=self.location
-            )
+            location_enhancement = _location_enhancement(self.location)
             return f"{base_prompt}\n\n{location_enhancement}"
         
         return base_prompt
@@ -39,147 +257,48 @@ class ArchitectureResearchConfig:
     
     def get_report_template(self, research_brief, findings, date):
         """Get architecture-specific report template."""
-        return architecture_report_template.format(
+        return _render_report_template(
             research_brief=research_brief,
             findings=findings,
             date=date
         )
     
+    def get_fused_brief_and_report_prompt(self, messages, findings, date):
+        """Get a single prompt that produces both the research brief and the final report."""
+        return _render_fused_prompt(
+            research_prompt=self.get_enhanced_research_prompt(messages, date),
+            report_prompt=self.get_report_template(FUSED_BRIEF_PLACEHOLDER, findings, date)
+        )
+    
     def get_search_keywords_enhancement(self, base_query):
         """Enhance search queries with architecture-specific keywords."""
-        architecture_keywords = [
-            "architecture trends",
-            "building design",
-            "construction innovation",
-            "sustainable architecture",
-            "green building",
-            "smart buildings",
-            "architectural materials",
-            "design trends",
-            "building technology",
-            "energy efficiency",
-            "LEED certification",
-            "biophilic design",
-            "modular construction",
-            "prefab architecture"
-        ]
-        
-        # Add location-specific terms if specified
-        if self.location and self.location != "Global":
-            location_terms = [
-                f"{self.location} architecture",
-                f"{self.location} building codes",
-                f"{self.location} construction trends",
-                f"{self.location} real estate"
-            ]
-            architecture_keywords.extend(location_terms)
-        
-        # Add year-specific terms
-        year_terms = [
-            f"{self.year} architecture trends",
-            f"{self.year} building trends",
-            f"{self.year} construction trends"
-        ]
-        architecture_keywords.extend(year_terms)
-        
+        # Query-independent terms are specialized once per (location, year) and memoized
+        enhanced_suffix, fallback_suffixes = _search_keyword_terms(self.location, self.year)
         return {
-            "enhanced_query": f"{base_query} {' '.join(architecture_keywords[:5])}",
-            "fallback_queries": [
-                f"{base_query} architecture design trends {self.year}",
-                f"{base_query} building construction innovation {self.location}",
-                f"{base_query} sustainable architecture {self.year}",
-                f"{base_query} smart building technology trends"
-            ]
+            "enhanced_query": base_query + enhanced_suffix,
+            "fallback_queries": [base_query + suffix for suffix in fallback_suffixes]
         }
     
     def get_source_priorities(self):
-        """Define priority sources for architecture research."""
-        return {
-            "primary_sources": [
-                "archidaily.com",
-                "dezeen.com", 
-                "architecturaldigest.com",
-                "architecturalrecord.com",
-                "metropolismag.com",
-                "aia.org",
-                "usgbc.org",
-                "construction.com",
-                "bdcnetwork.com",
-                "greenbuildingadvisor.com"
-            ],
-            "secondary_sources": [
-                "archdaily.com",
-                "designboom.com",
-                "inhabitat.com",
-                "treehugger.com",
-                "constructiondive.com",
-                "buildinggreendigital.com",
-                "contractormag.com",
-                "constructionexec.com"
-            ],
-            "academic_sources": [
-                "sciencedirect.com",
-                "scholar.google.com",
-                "researchgate.net",
-                "ieee.org",
-                "journals.sagepub.com"
-            ]
-        }
+        """Define priority sources for architecture research.
+        
+        The returned dict is cached and shared between calls; copy it before mutating.
+        """
+        return SOURCE_PRIORITIES
     
     def get_quality_filters(self):
-        """Define quality filters for architecture research."""
-        return {
-            "required_keywords": [
-                "architecture", "building", "design", "construction", 
-                "sustainable", "trends", "innovation", "technology"
-            ],
-            "preferred_date_range": {
-                "start_year": self.year - 2,
-                "end_year": self.year + 1
-            },
-            "exclude_patterns": [
-                "listicle", "top 10", "clickbait", "advertisement",
-                "sponsored content", "press release"
-            ],
-            "minimum_content_length": 500,  # words
-            "required_elements": [
-                "specific examples",
-                "expert quotes",
-                "quantitative data",
-                "project details"
-            ]
-        }
+        """Define quality filters for architecture research.
+        
+        The returned dict is cached and shared between calls; copy it before mutating.
+        """
+        return _quality_filters(self.year)
     
     def get_validation_criteria(self):
-        """Define validation criteria for architecture trend reports."""
-        return {
-            "content_requirements": {
-                "minimum_trends": 3,
-                "minimum_examples_per_trend": 2,
-                "minimum_sources": 10,
-                "required_sections": [
-                    "Executive Summary",
-                    "Current Market Landscape", 
-                    "Top Architecture Trends",
-                    "Implementation Recommendations",
-                    "Sources"
-                ]
-            },
-            "quality_indicators": {
-                "specific_project_examples": True,
-                "cost_information": True,
-                "timeline_projections": True,
-                "expert_quotes": True,
-                "quantitative_data": True,
-                "regional_considerations": True
-            },
-            "technical_depth": {
-                "material_specifications": True,
-                "technology_details": True,
-                "implementation_challenges": True,
-                "regulatory_considerations": True
-            }
-        }
+        """Define validation criteria for architecture trend reports.
+        
+        The returned dict is cached and shared between calls; copy it before mutating.
+        """
+        return VALIDATION_CRITERIA
 
 # Factory function to create architecture-specific configuration
 def create_architecture_config(location=None, year=None, industry_focus=None):
@@ -192,13 +311,21 @@ def create_architecture_config(location=None, year=None, industry_focus=None):
 
 # Integration helper for the main research system
 def enhance_research_for_architecture(base_config, arch_config):
-    """Enhance the base research configuration with architecture-specific settings."""
+    """Enhance the base research configuration with architecture-specific settings.
+    
+    The returned dict is cached per configuration and shared between calls; copy it before mutating.
+    """
+    return _architecture_enhancements(arch_config)
+
+@lru_cache(maxsize=128)
+def _architecture_enhancements(arch_config):
+    """Build the architecture enhancements; memoized per (immutable, hashable) configuration."""
     
     # This would be called during research initialization to modify prompts and behavior
     enhancements = {
         "specialized_prompts": {
             "research_topic_transform": arch_config.get_enhanced_research_prompt,
-            "research_instructions": arch_config.get_research_instructions(),
+            "research_instructions": arch_config.research_instructions,
             "report_template": arch_config.get_report_template
         },
         "search_enhancements": {
@@ -209,4 +336,4 @@ def enhance_research_for_architecture(base_config, arch_config):
         "validation_criteria": arch_config.get_validation_criteria()
     }
     
-    return enhancements 
\ No newline at end of file
+    return enhancements
@@ -214,4 +214,22 @@ location_based_research_prompt = """When researching architecture trends for {lo
 - Tax implications for different building approaches
 
 Research should prioritize sources and examples specifically relevant to {location} while also drawing insights from similar climates and markets globally.
-""" 
\ No newline at end of file
+""" 
+# Single-call prompt that produces both the research brief and the final report
+architecture_fused_brief_and_report_prompt = """You will complete two tasks in a single response: first write a research brief, then write the final architecture trend report.
+
+**Task 1 - Research Brief:**
+{research_prompt}
+
+**Task 2 - Final Report:**
+{report_prompt}
+
+**Output Format:**
+Respond with exactly two tagged sections and nothing outside them:
+<brief>
+[The research question from Task 1]
+</brief>
+<report>
+[The complete markdown report from Task 2]
+</report>
+"""
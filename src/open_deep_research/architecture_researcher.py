@@ -3,147 +3,241 @@ Architecture-specialized deep researcher that enhances the base research system
 with architecture-specific prompts, search strategies, and report formatting.
 """
 
-from typing import Optional, Dict, Any
-from langchain_core.runnables import RunnableConfig
-from langchain_core.messages import HumanMessage
+import re
+import asyncio
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Literal, Tuple
 
-from .deep_researcher import (
-    deep_researcher_builder,
-    transform_messages_into_research_topic,
-    AgentState
-)
-from .prompts import (
-    clarify_with_user_instructions,
-    lead_researcher_prompt,
-    research_system_prompt,
-    summarize_webpage_prompt
+# Only pure-Python modules are imported at module level. LangChain/LangGraph, the graph state types and the
+# base researcher are imported inside the nodes and graph builder that need them, so the query/validation
+# helpers below can be used without loading LangChain. Node annotations are strings for the same reason;
+# their Command destinations are passed to add_node explicitly.
+from .architecture_config import REQUIRED_KEYWORD_VARIANTS, create_architecture_config
+from .architecture_prompts import architecture_research_instructions
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.types import Command
+    from .architecture_state import ArchitectureAgentState
+
+# Configurations are immutable, so a single default instance is shared by every run
+_DEFAULT_ARCH_CONFIG = create_architecture_config()
+
+# Location hints in priority order, mapped to the canonical location they imply
+_LOCATION_MAP = {
+    'new york': 'New York, USA',
+    'california': 'California, USA',
+    'london': 'London, UK',
+    'tokyo': 'Tokyo, Japan',
+    'paris': 'Paris, France',
+    'berlin': 'Berlin, Germany',
+    'sydney': 'Sydney, Australia',
+    'toronto': 'Toronto, Canada',
+    'usa': 'United States',
+    'europe': 'Europe',
+    'asia': 'Asia'
+}
+_LOCATION_PRIORITY = {keyword: index for index, keyword in enumerate(_LOCATION_MAP)}
+_LOCATION_PATTERN = re.compile(
+    r'\b(' + '|'.join(re.escape(keyword) for keyword in _LOCATION_MAP) + r')\b',
+    re.IGNORECASE
 )
-from .architecture_config import create_architecture_config
-from .architecture_prompts import (
-    architecture_research_topic_prompt,
-    architecture_research_instructions,
-    architecture_report_template
+_YEAR_PATTERN = re.compile(r'20(2[4-9]|3[0-5])')  # 2024-2035
+
+ARCHITECTURE_SEARCH_TERMS = (
+    "architecture trends",
+    "building design innovation",
+    "sustainable construction",
+    "smart building technology",
+    "green architecture",
+    "modular construction",
+    "prefab housing",
+    "energy efficient buildings",
+    "LEED certified projects",
+    "biophilic design"
 )
-from .configuration import Configuration
+_TOP_ARCHITECTURE_TERMS = ARCHITECTURE_SEARCH_TERMS[:3]
 
-async def architecture_transform_messages_into_research_topic(
-    state: AgentState, config: RunnableConfig
-) -> Dict[str, Any]:
+# Briefs and findings small enough to fit one context window skip the separate brief LLM call.
+# Sizes are estimated at ~4 characters per token.
+FUSED_MAX_MESSAGE_TOKENS = 4000
+FUSED_MAX_FINDINGS_TOKENS = 16000
+_BRIEF_AND_REPORT_PATTERN = re.compile(r"<brief>(.*?)</brief>\s*<report>(.*?)</report>", re.DOTALL)
+
+# Lowercase terms used by the report quality heuristics
+_PROJECT_TERMS = ("project", "building")
+_COST_TERMS = ("cost", "$", "budget", "price", "expensive", "affordable")
+
+def _location_from_content(content: str) -> Optional[str]:
+    """Return the highest-priority location mentioned in the content, if any."""
+    matches = {match.lower() for match in _LOCATION_PATTERN.findall(content)}
+    if not matches:
+        return None
+    return _LOCATION_MAP[min(matches, key=_LOCATION_PRIORITY.__getitem__)]
+
+@lru_cache(maxsize=256)
+def _extract_location_year(message_contents: Tuple[str, ...]) -> Tuple[Optional[str], Optional[int]]:
     """
-    Architecture-specific version of research topic transformation.
-    Uses specialized prompts for better architecture trend research.
+    Extract location and year hints from message contents; the last message mentioning either wins.
+    Memoized on the message contents so retries over the same conversation skip the scan.
     """
-    configurable = Configuration.from_runnable_config(config)
-    
-    # Extract parameters from the request
-    messages = state["messages"]
-    
-    # Try to extract location and year from messages for customization
     location = None
     year = None
     
     # Simple extraction logic - could be enhanced
-    for message in messages:
-        content = message.content.lower() if hasattr(message, 'content') else str(message).lower()
+    for content in message_contents:
+        content = content.lower()
         
         # Extract location hints
-        location_keywords = {
-            'new york': 'New York, USA',
-            'california': 'California, USA', 
-            'london': 'London, UK',
-            'tokyo': 'Tokyo, Japan',
-            'paris': 'Paris, France',
-            'berlin': 'Berlin, Germany',
-            'sydney': 'Sydney, Australia',
-            'toronto': 'Toronto, Canada',
-            'usa': 'United States',
-            'europe': 'Europe',
-            'asia': 'Asia'
-        }
-        
-        for keyword, location_value in location_keywords.items():
-            if keyword in content:
-                location = location_value
-                break
+        location_match = _location_from_content(content)
+        if location_match:
+            location = location_match
         
         # Extract year hints
-        import re
-        year_match = re.search(r'20(2[4-9]|3[0-5])', content)  # 2024-2035
+        year_match = _YEAR_PATTERN.search(content)
         if year_match:
             year = int(year_match.group())
     
-    # Create architecture-specific configuration
-    arch_config = create_architecture_config(
+    return location, year
+
+def _join_research_findings(findings: list) -> str:
+    """Join research findings into one block in a single pass, each padded by blank lines."""
+    return "".join([f"\n\n{finding}\n\n" for finding in findings])
+
+def _architecture_config_from_messages(messages: list):
+    """Create an architecture configuration customized by location and year hints in the messages."""
+    message_contents = tuple(
+        str(message.content) if hasattr(message, 'content') else str(message)
+        for message in messages
+    )
+    location, year = _extract_location_year(message_contents)
+    return create_architecture_config(
         location=location,
         year=year or 2025,
         industry_focus="Architecture & Construction"
     )
+
+async def architecture_transform_messages_into_research_topic(
+    state: "ArchitectureAgentState", config: "RunnableConfig"
+) -> "Command[Literal['research_supervisor']]":
+    """
+    Architecture-specific version of research topic transformation.
+    Uses specialized prompts for better architecture trend research, then hands the brief to the research supervisor.
+    """
+    from langchain_core.messages import HumanMessage, SystemMessage, get_buffer_string
+    from langgraph.types import Command
+    from .configuration import Configuration
+    from .deep_researcher import configurable_model
+    from .prompts import lead_researcher_prompt
+    from .utils import cached_model_ainvoke, get_api_key_for_model, get_today_str
+    
+    configurable = Configuration.from_runnable_config(config)
+    today = get_today_str()
+    
+    # Extract parameters from the request
+    messages = state["messages"]
+    
+    # Create architecture-specific configuration from location and year hints in the messages
+    arch_config = _architecture_config_from_messages(messages)
     
     # Use architecture-specific prompt
     enhanced_prompt = arch_config.get_enhanced_research_prompt(
-        messages=messages,
-        date=configurable.get_today()
+        messages=get_buffer_string(messages),
+        date=today
     )
     
     # Get the research topic using enhanced prompt
     model_config = {
-        "model": configurable.research_topic_gen_model,
-        "max_tokens": configurable.research_topic_gen_model_max_tokens,
+        "model": configurable.research_model,
+        "max_tokens": configurable.research_model_max_tokens,
+        "api_key": get_api_key_for_model(configurable.research_model, config),
     }
     
-    configurable_model = configurable.get_model()
-    
     try:
-        research_topic = await configurable_model.with_config(model_config).ainvoke([
-            HumanMessage(content=enhanced_prompt)
-        ])
-        
-        return {
-            "research_topic": research_topic.content,
-            "messages": state["messages"] + [research_topic],
-            "architecture_config": arch_config  # Store for later use
+        research_topic = await cached_model_ainvoke(
+            configurable_model, model_config, enhanced_prompt, namespace="architecture_research_topic"
+        )
+    except Exception:
+        # Fall back to the base research brief node if enhancement fails; it routes to the supervisor as well
+        from .deep_researcher import write_research_brief
+        return await write_research_brief(state, config)
+    
+    research_brief = str(research_topic.content)
+    return Command(
+        goto="research_supervisor",
+        update={
+            "research_brief": research_brief,
+            "architecture_config": arch_config,  # Store for later use
+            "supervisor_messages": {
+                "type": "override",
+                "value": [
+                    SystemMessage(content=lead_researcher_prompt.format(
+                        date=today,
+                        max_concurrent_research_units=configurable.max_concurrent_research_units
+                    )),
+                    HumanMessage(content=research_brief)
+                ]
+            }
         }
-        
-    except Exception as e:
-        # Fallback to original method if enhancement fails
-        return await transform_messages_into_research_topic(state, config)
+    )
 
-async def architecture_final_report_generation(state: AgentState, config: RunnableConfig):
+async def batch_architecture_transform(
+    states: List["ArchitectureAgentState"], config: "RunnableConfig"
+) -> "List[Command[Literal['research_supervisor']]]":
+    """
+    Transform several research requests into research topics concurrently.
+    The LLM calls are network-bound, so running them together costs roughly one call's latency. Like the
+    supervisor's research fan-out, at most max_concurrent_research_units calls are in flight at once.
+    Results are returned in the same order as the input states.
+    """
+    from .configuration import Configuration
+    
+    configurable = Configuration.from_runnable_config(config)
+    semaphore = asyncio.Semaphore(configurable.max_concurrent_research_units)
+    
+    async def transform_with_limit(state: "ArchitectureAgentState"):
+        async with semaphore:
+            return await architecture_transform_messages_into_research_topic(state, config)
+    
+    return await asyncio.gather(*[transform_with_limit(state) for state in states])
+
+async def architecture_final_report_generation(state: "ArchitectureAgentState", config: "RunnableConfig"):
     """
     Architecture-specific final report generation with enhanced formatting and structure.
     """
+    from .configuration import Configuration
+    from .deep_researcher import configurable_model
+    from .utils import cached_model_ainvoke, get_api_key_for_model, get_today_str
+    
     configurable = Configuration.from_runnable_config(config)
+    today = get_today_str()
     
-    # Get architecture configuration from state or create default
-    arch_config = state.get("architecture_config")
-    if not arch_config:
-        arch_config = create_architecture_config()
+    # Get architecture configuration from state or fall back to the shared default
+    arch_config = state.get("architecture_config") or _DEFAULT_ARCH_CONFIG
     
-    research_findings = ""
-    if state.get("research_findings"):
-        for finding in state["research_findings"]:
-            research_findings += f"\n\n{finding}\n\n"
+    cleared_state = {"notes": {"type": "override", "value": []}}
+    research_findings = _join_research_findings(state.get("notes", []))
     
-    research_brief = state.get("research_topic", "Architecture trend analysis")
+    research_brief = state.get("research_brief") or "Architecture trend analysis"
     
     # Use architecture-specific report template
     final_report_prompt = arch_config.get_report_template(
         research_brief=research_brief,
         findings=research_findings,
-        date=configurable.get_today()
+        date=today
     )
     
     model_config = {
         "model": configurable.final_report_model,
         "max_tokens": configurable.final_report_model_max_tokens,
+        "api_key": get_api_key_for_model(configurable.final_report_model, config),
     }
     
-    configurable_model = configurable.get_model()
-    
     try:
-        final_report = await configurable_model.with_config(model_config).ainvoke([
-            HumanMessage(content=final_report_prompt)
-        ])
+        final_report = await cached_model_ainvoke(
+            configurable_model, model_config, final_report_prompt, namespace="architecture_final_report"
+        )
         
         # Enhance the report with architecture-specific formatting
         enhanced_report = enhance_architecture_report(final_report.content, arch_config)
@@ -151,13 +245,120 @@ async def architecture_final_report_generation(state: AgentState, config: Runnab
         return {
             "final_report": enhanced_report,
             "messages": [final_report],
+            **cleared_state
         }
         
     except Exception as e:
         return {
             "final_report": f"Error generating architecture trend report: {e}",
             "messages": [],
+            **cleared_state
+        }
+
+def parse_brief_and_report(content: str) -> Optional[Tuple[str, str]]:
+    """
+    Extract the (brief, report) sections from a fused response, or None if either tagged section is missing or empty.
+    """
+    match = _BRIEF_AND_REPORT_PATTERN.search(content)
+    if not match:
+        return None
+    research_brief, report = (section.strip() for section in match.groups())
+    if not research_brief or not report:
+        return None
+    return research_brief, report
+
+def should_fuse_transform_and_report(state: "ArchitectureAgentState") -> bool:
+    """
+    Check whether the brief and report can be generated in one LLM call.
+    Requires research findings (notes) to already be available and both inputs to be small enough to share a context window.
+    """
+    notes = state.get("notes")
+    if not notes:
+        return False
+    messages_chars = sum(len(str(getattr(message, "content", message))) for message in state["messages"])
+    notes_chars = sum(len(str(note)) for note in notes)
+    return messages_chars < FUSED_MAX_MESSAGE_TOKENS * 4 and notes_chars < FUSED_MAX_FINDINGS_TOKENS * 4
+
+async def route_architecture_research(
+    state: "ArchitectureAgentState", config: "RunnableConfig"
+) -> "Command[Literal['fused_transform_and_report', 'clarify_with_user']]":
+    """
+    Route short requests that arrive with findings to the fused node, everything else to the full research pipeline.
+    """
+    from langgraph.types import Command
+    
+    if should_fuse_transform_and_report(state):
+        return Command(goto="fused_transform_and_report")
+    return Command(goto="clarify_with_user")
+
+async def architecture_fused_transform_and_report(
+    state: "ArchitectureAgentState", config: "RunnableConfig"
+) -> "Command[Literal['write_research_brief', '__end__']]":
+    """
+    Generate the research brief and final report in a single LLM call, saving one round-trip.
+    Falls back to the two-phase brief -> research -> report pipeline if the response cannot be parsed.
+    """
+    from langchain_core.messages import get_buffer_string
+    from langgraph.graph import END
+    from langgraph.types import Command
+    from .configuration import Configuration
+    from .deep_researcher import configurable_model
+    from .utils import cached_model_ainvoke, get_api_key_for_model, get_today_str
+    
+    configurable = Configuration.from_runnable_config(config)
+    today = get_today_str()
+    messages = state["messages"]
+    arch_config = _architecture_config_from_messages(messages)
+    
+    research_findings = _join_research_findings(state["notes"])
+    
+    fused_prompt = arch_config.get_fused_brief_and_report_prompt(
+        messages=get_buffer_string(messages),
+        findings=research_findings,
+        date=today
+    )
+    
+    model_config = {
+        "model": configurable.final_report_model,
+        "max_tokens": configurable.final_report_model_max_tokens,
+        "api_key": get_api_key_for_model(configurable.final_report_model, config),
+    }
+    
+    cleared_state = {"notes": {"type": "override", "value": []}}
+    
+    try:
+        response = await cached_model_ainvoke(
+            configurable_model, model_config, fused_prompt, namespace="architecture_fused_brief_and_report"
+        )
+    except Exception as e:
+        # A failed model call (API, auth, rate limit) would fail the longer pipeline too, so report it instead
+        logging.warning(f"Fused architecture brief and report generation failed: {e}")
+        return Command(
+            goto=END,
+            update={
+                "final_report": f"Error generating architecture trend report: {e}",
+                "messages": [],
+                **cleared_state
+            }
+        )
+    
+    sections = parse_brief_and_report(str(response.content))
+    if sections is None:
+        # Fall back to the two-phase pipeline; the provided notes are kept and extended by the research step
+        logging.warning("Fused architecture response had no <brief>/<report> sections; falling back to the full research pipeline")
+        return Command(goto="write_research_brief")
+    
+    research_brief, report = sections
+    return Command(
+        goto=END,
+        update={
+            "research_brief": research_brief,
+            "final_report": enhance_architecture_report(report, arch_config),
+            "messages": [response],
+            "architecture_config": arch_config,
+            **cleared_state
         }
+    )
 
 def enhance_architecture_report(report_content: str, arch_config) -> str:
     """
@@ -176,9 +377,10 @@ and budget constraints. Consult with licensed architects and engineers for speci
 ---
 """
     
-    # Add metadata section
+    # Add metadata section, spelling out the content requirements rather than printing the raw criteria
+    content_req = arch_config.get_validation_criteria()["content_requirements"]
     metadata = f"""
-**Report Generated:** {arch_config.get_validation_criteria()['content_requirements']}
+**Report Standards:** at least {content_req['minimum_trends']} trends, {content_req['minimum_examples_per_trend']} examples per trend and {content_req['minimum_sources']} sources; sections: {', '.join(content_req['required_sections'])}
 **Focus Area:** {arch_config.industry_focus}
 **Geographic Scope:** {arch_config.location}
 **Time Frame:** {arch_config.year}
@@ -193,14 +395,33 @@ and budget constraints. Consult with licensed architects and engineers for speci
 def create_architecture_research_system():
     """
     Create a specialized research system for architecture trends.
+    Mirrors the base deep researcher graph, with the brief and report nodes replaced by
+    architecture-enhanced versions and a fused single-call path for requests that arrive with findings.
     """
-    
-    # Clone the base builder
-    arch_builder = deep_researcher_builder.get_graph().copy()
-    
-    # Replace specific nodes with architecture-enhanced versions
-    arch_builder.nodes["transform_messages_into_research_topic"] = architecture_transform_messages_into_research_topic
-    arch_builder.nodes["final_report_generation"] = architecture_final_report_generation
+    from langgraph.graph import START, END, StateGraph
+    from .architecture_state import ArchitectureAgentState, ArchitectureInputState
+    from .configuration import Configuration
+    from .deep_researcher import clarify_with_user, supervisor_subgraph
+    
+    arch_builder = StateGraph(ArchitectureAgentState, input=ArchitectureInputState, config_schema=Configuration)
+    arch_builder.add_node(
+        "route_architecture_research", route_architecture_research,
+        destinations=("fused_transform_and_report", "clarify_with_user")
+    )
+    arch_builder.add_node(
+        "fused_transform_and_report", architecture_fused_transform_and_report,
+        destinations=("write_research_brief", END)
+    )
+    arch_builder.add_node("clarify_with_user", clarify_with_user)
+    arch_builder.add_node(
+        "write_research_brief", architecture_transform_messages_into_research_topic,
+        destinations=("research_supervisor",)
+    )
+    arch_builder.add_node("research_supervisor", supervisor_subgraph)
+    arch_builder.add_node("final_report_generation", architecture_final_report_generation)
+    arch_builder.add_edge(START, "route_architecture_research")
+    arch_builder.add_edge("research_supervisor", "final_report_generation")
+    arch_builder.add_edge("final_report_generation", END)
     
     return arch_builder.compile()
 
@@ -216,32 +437,51 @@ def enhance_search_queries_for_architecture(base_queries: list, location: str =
     """
     Enhance search queries with architecture-specific terms and filters.
     """
-    enhanced_queries = []
-    
-    architecture_terms = [
-        "architecture trends",
-        "building design innovation", 
-        "sustainable construction",
-        "smart building technology",
-        "green architecture",
-        "modular construction",
-        "prefab housing",
-        "energy efficient buildings",
-        "LEED certified projects",
-        "biophilic design"
-    ]
-    
-    for query in base_queries:
-        # Add architecture context to each query
-        for term in architecture_terms[:3]:  # Use top 3 most relevant terms
-            enhanced_query = f"{query} {term}"
-            if location:
-                enhanced_query += f" {location}"
-            if year:
-                enhanced_query += f" {year}"
-            enhanced_queries.append(enhanced_query)
-    
-    return enhanced_queries
+    # Location/year context is identical for every query, so build it once
+    suffix = (f" {location}" if location else "") + (f" {year}" if year else "")
+    
+    # Add architecture context to each query using the top 3 most relevant terms
+    return [f"{query} {term}{suffix}" for query in base_queries for term in _TOP_ARCHITECTURE_TERMS]
+
+@lru_cache(maxsize=32)
+def _compile_phrase_pattern(phrases: frozenset) -> re.Pattern:
+    """
+    Compile phrases into one whole-word alternation regex. The zero-width lookahead lets findall report
+    overlapping matches, so every phrase occurrence is found in a single pass over the content.
+    """
+    alternation = '|'.join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True))
+    return re.compile(r'(?=\b(' + alternation + r')\b)')
+
+@lru_cache(maxsize=32)
+def _keyword_forms(keywords: frozenset) -> Dict[str, str]:
+    """Map every accepted word form of the keywords back to its keyword."""
+    return {
+        form: keyword
+        for keyword in keywords
+        for form in REQUIRED_KEYWORD_VARIANTS.get(keyword, (keyword,))
+    }
+
+def find_quality_filter_matches(content: str, arch_config) -> Dict[str, Any]:
+    """
+    Find which required keywords and excluded patterns from the quality filters appear in the content.
+    Required keywords also match their listed word forms (e.g. "buildings" covers "building",
+    "sustainability" covers "sustainable"); everything else only matches as whole words or phrases.
+    """
+    quality_filters = arch_config.get_quality_filters()
+    required_keywords = frozenset(quality_filters["required_keywords"])
+    exclude_patterns = frozenset(quality_filters["exclude_patterns"])
+    
+    lower_content = content.lower()
+    keyword_forms = _keyword_forms(required_keywords)
+    found_forms = _compile_phrase_pattern(frozenset(keyword_forms)).findall(lower_content)
+    found_keywords = {keyword_forms[form] for form in found_forms}
+    found_patterns = set(_compile_phrase_pattern(exclude_patterns).findall(lower_content))
+    
+    return {
+        "found_keywords": found_keywords,
+        "missing_keywords": required_keywords - found_keywords,
+        "excluded_patterns_found": found_patterns
+    }
 
 # Quality validation for architecture reports
 def validate_architecture_report_quality(report_content: str, arch_config) -> Dict[str, Any]:
@@ -256,18 +496,21 @@ def validate_architecture_report_quality(report_content: str, arch_config) -> Di
         "recommendations": []
     }
     
+    # Lowercase the (potentially very large) report once and reuse it for every check
+    lower_content = report_content.lower()
+    
     # Check content requirements
     content_req = validation_criteria["content_requirements"]
     
     # Count trends mentioned (simple heuristic)
-    trend_count = report_content.lower().count("trend")
+    trend_count = lower_content.count("trend")
     if trend_count < content_req["minimum_trends"]:
         results["issues"].append(f"Report mentions {trend_count} trends, minimum required: {content_req['minimum_trends']}")
         results["passes_validation"] = False
     
     # Check for required sections
     for section in content_req["required_sections"]:
-        if section.lower() not in report_content.lower():
+        if section.lower() not in lower_content:
             results["issues"].append(f"Missing required section: {section}")
             results["passes_validation"] = False
     
@@ -276,13 +519,23 @@ def validate_architecture_report_quality(report_content: str, arch_config) -> Di
     
     # Check for specific project examples
     if quality_indicators["specific_project_examples"]:
-        if "project" not in report_content.lower() and "building" not in report_content.lower():
+        if not any(term in lower_content for term in _PROJECT_TERMS):
             results["recommendations"].append("Consider adding specific project examples")
     
     # Check for cost information
     if quality_indicators["cost_information"]:
-        cost_terms = ["cost", "$", "budget", "price", "expensive", "affordable"]
-        if not any(term in report_content.lower() for term in cost_terms):
+        if not any(term in lower_content for term in _COST_TERMS):
             results["recommendations"].append("Consider adding cost analysis and budget implications")
     
+    # Check the report against the configured quality filters
+    filter_matches = find_quality_filter_matches(report_content, arch_config)
+    if filter_matches["missing_keywords"]:
+        results["recommendations"].append(
+            f"Consider covering: {', '.join(sorted(filter_matches['missing_keywords']))}"
+        )
+    if filter_matches["excluded_patterns_found"]:
+        results["recommendations"].append(
+            f"Remove low-quality content patterns: {', '.join(sorted(filter_matches['excluded_patterns_found']))}"
+        )
+    
     return results 
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""
+Graph state definitions for the architecture-specialized deep researcher.
+Kept separate from state.py so the base researcher does not depend on the architecture specialization.
+"""
+
+from typing import Annotated, Optional
+
+from open_deep_research.architecture_config import ArchitectureResearchConfig
+from open_deep_research.state import AgentInputState, AgentState, override_reducer
+
+class ArchitectureInputState(AgentInputState):
+    """Messages, plus optional pre-gathered research findings to report on"""
+    notes: Annotated[list[str], override_reducer]
+
+class ArchitectureAgentState(AgentState):
+    architecture_config: Optional[ArchitectureResearchConfig]
@@ -1,8 +1,13 @@
 import os
+import json
+import sqlite3
+import hashlib
 import aiohttp
 import asyncio
 import logging
 import warnings
+from contextlib import closing
+from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, List, Literal, Dict, Optional, Any
 from langchain_core.tools import BaseTool, StructuredTool, tool, ToolException, InjectedToolArg
@@ -443,6 +448,70 @@ def remove_up_to_last_ai_message(messages: list[MessageLikeRepresentation]) -> l
             return messages[:i]  # Return everything up to (but not including) the last AI message
     return messages
 
+##########################
+# LLM Response Cache Utils
+##########################
+def is_llm_response_cache_enabled() -> bool:
+    """Check whether LLM responses should be memoized on disk (opt-in via CACHE_LLM_RESPONSES)."""
+    return os.getenv("CACHE_LLM_RESPONSES", "false").lower() == "true"
+
+def get_llm_response_cache_path() -> Path:
+    """Get the SQLite file backing the LLM response cache."""
+    cache_dir = os.getenv("LLM_RESPONSE_CACHE_DIR") or Path.home() / ".cache" / "open_deep_research"
+    return Path(cache_dir) / "llm_responses.sqlite"
+
+def get_llm_response_cache_key(namespace: str, prompt: str, model_config: dict) -> str:
+    """Build a stable cache key from the prompt and the model settings that affect the output (never the API key)."""
+    model_settings = {k: v for k, v in model_config.items() if k != "api_key"}
+    payload = json.dumps({"namespace": namespace, "prompt": prompt, "model": model_settings}, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+# Cache files whose directory and table have already been created in this process
+_initialized_llm_response_cache_paths: set[Path] = set()
+
+def _connect_llm_response_cache() -> sqlite3.Connection:
+    path = get_llm_response_cache_path()
+    if path in _initialized_llm_response_cache_paths:
+        return sqlite3.connect(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)")
+    _initialized_llm_response_cache_paths.add(path)
+    return conn
+
+def _read_llm_response_cache(key: str) -> Optional[str]:
+    with closing(_connect_llm_response_cache()) as conn:
+        row = conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+def _write_llm_response_cache(key: str, content: str) -> None:
+    with closing(_connect_llm_response_cache()) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)", (key, content))
+
+async def cached_model_ainvoke(model, model_config: dict, prompt: str, namespace: str) -> AIMessage:
+    """Invoke the model on a single human prompt, memoizing the response on disk when enabled.
+
+    Cache hits are returned as an AIMessage carrying the stored content. Only text responses are cached,
+    and cache read/write failures fall back to a normal model call rather than failing the run.
+    """
+    if not is_llm_response_cache_enabled():
+        return await model.with_config(model_config).ainvoke([HumanMessage(content=prompt)])
+    key = get_llm_response_cache_key(namespace, prompt, model_config)
+    try:
+        cached_content = await asyncio.to_thread(_read_llm_response_cache, key)
+    except (sqlite3.Error, OSError) as e:
+        logging.warning(f"Failed to read LLM response cache: {e}")
+        cached_content = None
+    if cached_content is not None:
+        return AIMessage(content=cached_content)
+    response = await model.with_config(model_config).ainvoke([HumanMessage(content=prompt)])
+    if isinstance(response.content, str):
+        try:
+            await asyncio.to_thread(_write_llm_response_cache, key, response.content)
+        except (sqlite3.Error, OSError) as e:
+            logging.warning(f"Failed to write LLM response cache: {e}")
+    return response
+
 ##########################
 # Misc Utils
 ##########################
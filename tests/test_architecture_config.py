@@ -0,0 +1,70 @@
+import dataclasses
+
+import pytest
+
+from open_deep_research.architecture_config import _compile_template, create_architecture_config
+from open_deep_research.architecture_prompts import (
+    architecture_fused_brief_and_report_prompt,
+    architecture_report_template,
+    architecture_research_topic_prompt,
+    location_based_research_prompt,
+)
+
+# Values include braces and format-like text, which must be substituted verbatim
+VALUES = {
+    "messages": "Human: {looks like a field} and {{braces}}",
+    "date": "Thu Oct 15, 2026",
+    "research_brief": "Sustainable housing trends in Tokyo",
+    "findings": "\n\nFinding with 100% {data}\n\n",
+    "location": "Tokyo, Japan",
+    "research_prompt": "Task one {x}",
+    "report_prompt": "Task two {y}",
+}
+
+
+@pytest.mark.parametrize("template", [
+    architecture_research_topic_prompt,
+    architecture_report_template,
+    location_based_research_prompt,
+    architecture_fused_brief_and_report_prompt,
+])
+def test_compiled_prompts_match_str_format(template):
+    assert _compile_template(template)(**VALUES) == template.format(**VALUES)
+
+
+def test_escaped_braces_match_str_format():
+    template = "{{literal}} {name} {{{name}}} }}"
+    assert _compile_template(template)(name="x") == template.format(name="x")
+
+
+def test_missing_value_raises_key_error():
+    with pytest.raises(KeyError):
+        _compile_template("{name}")()
+
+
+@pytest.mark.parametrize("template", ["{name!r}", "{name:>10}", "{}", "{0}", "{name.attr}", "{name[0]}"])
+def test_unsupported_fields_are_rejected(template):
+    with pytest.raises(ValueError):
+        _compile_template(template)
+
+
+def test_config_fields_are_only_the_public_settings():
+    arch_config = create_architecture_config(location="Tokyo, Japan", year=2026)
+    assert dataclasses.asdict(arch_config) == {
+        "location": "Tokyo, Japan",
+        "year": 2026,
+        "industry_focus": "Architecture & Construction",
+    }
+
+
+def test_search_keywords_enhancement_is_specialized_per_location_and_year():
+    enhancement = create_architecture_config(location="Tokyo, Japan", year=2026).get_search_keywords_enhancement("q")
+    assert enhancement["enhanced_query"] == (
+        "q architecture trends building design construction innovation sustainable architecture green building"
+    )
+    assert enhancement["fallback_queries"] == [
+        "q architecture design trends 2026",
+        "q building construction innovation Tokyo, Japan",
+        "q sustainable architecture 2026",
+        "q smart building technology trends",
+    ]
@@ -0,0 +1,60 @@
+from langchain_core.messages import HumanMessage
+
+from open_deep_research.architecture_researcher import (
+    FUSED_MAX_FINDINGS_TOKENS,
+    FUSED_MAX_MESSAGE_TOKENS,
+    parse_brief_and_report,
+    should_fuse_transform_and_report,
+)
+
+
+def make_state(message="Residential trends in Tokyo", notes=None):
+    state = {"messages": [HumanMessage(content=message)]}
+    if notes is not None:
+        state["notes"] = notes
+    return state
+
+
+def test_no_notes_uses_full_pipeline():
+    assert not should_fuse_transform_and_report(make_state())
+    assert not should_fuse_transform_and_report(make_state(notes=[]))
+
+
+def test_small_request_with_notes_is_fused():
+    assert should_fuse_transform_and_report(make_state(notes=["Finding one", "Finding two"]))
+
+
+def test_notes_over_budget_use_full_pipeline():
+    notes = ["x" * (FUSED_MAX_FINDINGS_TOKENS * 4)]
+    assert not should_fuse_transform_and_report(make_state(notes=notes))
+
+
+def test_messages_over_budget_use_full_pipeline():
+    message = "x" * (FUSED_MAX_MESSAGE_TOKENS * 4)
+    assert not should_fuse_transform_and_report(make_state(message=message, notes=["Finding"]))
+
+
+def test_parse_tagged_sections():
+    content = "<brief>\n Tokyo housing trends \n</brief>\n\n<report>\n# Report\n\nBody\n</report>"
+    assert parse_brief_and_report(content) == ("Tokyo housing trends", "# Report\n\nBody")
+
+
+def test_parse_ignores_text_around_tags():
+    content = "Sure!\n<brief>Brief</brief><report>Report</report>\nDone."
+    assert parse_brief_and_report(content) == ("Brief", "Report")
+
+
+def test_parse_missing_tags_returns_none():
+    assert parse_brief_and_report("# Report without tags") is None
+    assert parse_brief_and_report("<brief>Brief only</brief>") is None
+
+
+def test_parse_malformed_tags_returns_none():
+    assert parse_brief_and_report("<brief>Brief<report>Report</report>") is None
+    assert parse_brief_and_report("<report>Report</report><brief>Brief</brief>") is None
+    assert parse_brief_and_report("<brief>Brief</brief><report>Report") is None
+
+
+def test_parse_empty_sections_returns_none():
+    assert parse_brief_and_report("<brief> </brief><report>Report</report>") is None
+    assert parse_brief_and_report("<brief>Brief</brief><report>\n</report>") is None
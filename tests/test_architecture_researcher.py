@@ -0,0 +1,65 @@
+from open_deep_research.architecture_config import create_architecture_config
+from open_deep_research.architecture_researcher import (
+    enhance_architecture_report,
+    find_quality_filter_matches,
+    validate_architecture_report_quality,
+)
+
+
+def test_required_keywords_match_inflected_forms():
+    matches = find_quality_filter_matches("Designs for new Buildings", create_architecture_config())
+    assert {"design", "building"} <= matches["found_keywords"]
+    assert "design" not in matches["missing_keywords"]
+    assert "building" not in matches["missing_keywords"]
+
+
+def test_required_keywords_match_listed_variants_not_prefixes():
+    matches = find_quality_filter_matches(
+        "A designated trend toward sustainability in new technologies", create_architecture_config()
+    )
+    assert {"trends", "sustainable", "technology"} <= matches["found_keywords"]
+    assert "design" in matches["missing_keywords"]
+
+
+def test_required_keywords_must_start_on_a_word_boundary():
+    matches = find_quality_filter_matches("A redesign of the rebuilding plan", create_architecture_config())
+    assert "design" in matches["missing_keywords"]
+    assert "building" in matches["missing_keywords"]
+
+
+def test_missing_keywords_complement_found_keywords():
+    arch_config = create_architecture_config()
+    matches = find_quality_filter_matches("Sustainable construction trends", arch_config)
+    required_keywords = frozenset(arch_config.get_quality_filters()["required_keywords"])
+    assert matches["found_keywords"] == {"sustainable", "construction", "trends"}
+    assert matches["missing_keywords"] == required_keywords - matches["found_keywords"]
+
+
+def test_exclude_patterns_match_whole_phrases_only():
+    matches = find_quality_filter_matches("Our TOP 10 picks, not a top 100 or press releases", create_architecture_config())
+    assert matches["excluded_patterns_found"] == {"top 10"}
+
+
+def test_overlapping_exclude_patterns_are_all_found():
+    matches = find_quality_filter_matches("sponsored content press release", create_architecture_config())
+    assert matches["excluded_patterns_found"] == {"sponsored content", "press release"}
+
+
+def test_validation_recommends_missing_keywords_and_flags_excluded_patterns():
+    results = validate_architecture_report_quality(
+        "Sponsored content: building design trends", create_architecture_config()
+    )
+    assert "Remove low-quality content patterns: sponsored content" in results["recommendations"]
+    assert (
+        "Consider covering: architecture, construction, innovation, sustainable, technology"
+        in results["recommendations"]
+    )
+
+
+def test_report_header_lists_required_sections_as_text():
+    report = enhance_architecture_report("Body", create_architecture_config())
+    assert (
+        "sections: Executive Summary, Current Market Landscape, Top Architecture Trends, "
+        "Implementation Recommendations, Sources\n"
+    ) in report
+    assert "('Executive Summary'" not in report
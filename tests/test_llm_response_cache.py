@@ -0,0 +1,107 @@
+import asyncio
+import sqlite3
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from open_deep_research import utils
+from open_deep_research.utils import cached_model_ainvoke, get_llm_response_cache_key
+
+MODEL_CONFIG = {"model": "openai:gpt-4.1", "max_tokens": 1000, "api_key": "sk-secret"}
+
+
+class FakeModel:
+    """Chat model stand-in that counts calls and answers every prompt with a fixed reply."""
+
+    def __init__(self, content="fresh response"):
+        self.content = content
+        self.calls = 0
+
+    def with_config(self, config):
+        return self
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return AIMessage(content=self.content)
+
+
+def invoke(model, prompt="Summarize these findings"):
+    return asyncio.run(cached_model_ainvoke(model, MODEL_CONFIG, prompt, "test"))
+
+
+@pytest.fixture
+def cache_enabled(monkeypatch, tmp_path):
+    monkeypatch.setenv("CACHE_LLM_RESPONSES", "true")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def test_disabled_cache_calls_the_model_without_touching_disk(monkeypatch, tmp_path):
+    monkeypatch.delenv("CACHE_LLM_RESPONSES", raising=False)
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(tmp_path / "cache"))
+
+    def fail():
+        raise AssertionError("cache accessed while disabled")
+
+    monkeypatch.setattr(utils, "_connect_llm_response_cache", fail)
+    model = FakeModel()
+    assert invoke(model).content == "fresh response"
+    assert invoke(model).content == "fresh response"
+    assert model.calls == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_cache_hit_skips_the_model(cache_enabled):
+    first = FakeModel("first response")
+    assert invoke(first).content == "first response"
+    second = FakeModel("second response")
+    assert invoke(second).content == "first response"
+    assert second.calls == 0
+    assert invoke(second, prompt="A different prompt").content == "second response"
+    assert second.calls == 1
+
+
+def test_cache_key_ignores_api_key_but_not_model_settings():
+    key = get_llm_response_cache_key("test", "prompt", MODEL_CONFIG)
+    assert key == get_llm_response_cache_key("test", "prompt", {**MODEL_CONFIG, "api_key": "sk-other"})
+    assert key == get_llm_response_cache_key("test", "prompt", {k: v for k, v in MODEL_CONFIG.items() if k != "api_key"})
+    assert key != get_llm_response_cache_key("test", "prompt", {**MODEL_CONFIG, "max_tokens": 2000})
+    assert key != get_llm_response_cache_key("other", "prompt", MODEL_CONFIG)
+
+
+def test_unusable_cache_dir_falls_back_to_the_model(monkeypatch, tmp_path):
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    monkeypatch.setenv("CACHE_LLM_RESPONSES", "true")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(blocker))
+    model = FakeModel()
+    assert invoke(model).content == "fresh response"
+    assert invoke(model).content == "fresh response"
+    assert model.calls == 2
+
+
+def test_failed_write_still_returns_the_response(monkeypatch, cache_enabled):
+    def fail_write(key, content):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(utils, "_write_llm_response_cache", fail_write)
+    model = FakeModel()
+    assert invoke(model).content == "fresh response"
+    assert invoke(model).content == "fresh response"
+    assert model.calls == 2
+
+
+def test_cache_setup_runs_once_per_path(monkeypatch, cache_enabled):
+    mkdir_calls = []
+    original_mkdir = utils.Path.mkdir
+
+    def counting_mkdir(self, *args, **kwargs):
+        mkdir_calls.append(self)
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(utils.Path, "mkdir", counting_mkdir)
+    model = FakeModel()
+    invoke(model)
+    invoke(model)
+    invoke(model, prompt="Another prompt")
+    assert mkdir_calls == [cache_enabled]